@@ -1,9 +1,14 @@
 import chess
+import chess.polyglot
 import pygame
 import sys
+import time
+import threading
 import random
 from pygame.locals import *
 
+from chess_gfx import get_indexed_piece_images
+
 # Initialize pygame
 pygame.init()
 
@@ -26,151 +31,385 @@ screen = pygame.display.set_mode(WINDOW_SIZE)
 pygame.display.set_caption('Chess Game with Alpha-Beta AI')
 clock = pygame.time.Clock()
 
-# Load chess piece images
-piece_images = {}
-pieces_map = {
-    'wp': 'white-pawn.png', 'wn': 'white-knight.png', 'wb': 'white-bishop.png', 'wr': 'white-rook.png', 'wq': 'white-queen.png', 'wk': 'white-king.png',
-    'bp': 'black-pawn.png', 'bn': 'black-knight.png', 'bb': 'black-bishop.png', 'br': 'black-rook.png', 'bq': 'black-queen.png', 'bk': 'black-king.png'
-}
-
-for piece_id, filename in pieces_map.items():
-    try:
-        # This uses a relative path, which is more robust
-        image_path = f"images/{filename}"
-        img = pygame.image.load(image_path)
-        img = pygame.transform.scale(img, (SQUARE_SIZE, SQUARE_SIZE))
-        piece_images[piece_id] = img
-    except pygame.error:
-        print(f"Warning: Could not load image for {piece_id} from {image_path}")
-        # Create a placeholder image if loading fails
-        img = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-        pygame.draw.rect(img, (255, 0, 0, 128), (0, 0, SQUARE_SIZE, SQUARE_SIZE))
-        piece_images[piece_id] = img
+# Load chess piece images, indexed as [color][piece_type]
+piece_images_indexed = get_indexed_piece_images(SQUARE_SIZE)
+
+# Screen position of each square (a1 is 0, h8 is 63), row inverted because chess uses 1-8 from bottom to top
+SQUARE_POS = [(chess.square_file(sq) * SQUARE_SIZE, (7 - chess.square_rank(sq)) * SQUARE_SIZE) for sq in chess.SQUARES]
+
+# Pre-render the static checkerboard once; draw_board just blits it
+BOARD_BG = pygame.Surface((BOARD_SIZE, BOARD_SIZE)).convert()
+for row in range(8):
+    for col in range(8):
+        color = LIGHT_SQUARE if (row + col) % 2 == 0 else DARK_SQUARE
+        pygame.draw.rect(BOARD_BG, color, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+
+# Semi-transparent overlay for the selected square, reused every frame
+HIGHLIGHT_SURF = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+HIGHLIGHT_SURF.fill(HIGHLIGHT)
+HIGHLIGHT_SURF = HIGHLIGHT_SURF.convert_alpha()
+
+# Piece values (standard chess piece weights), indexed by piece type
+# (chess.PAWN == 1 ... chess.KING == 6, index 0 is unused)
+PIECE_VALUES = (0, 100, 320, 330, 500, 900, 20000)  # High value for the king
+
+# Central squares (e4, d4, e5, d5) as a bitboard
+CENTER_MASK = chess.BB_E4 | chess.BB_D4 | chess.BB_E5 | chess.BB_D5
+
+# Everything except each side's back rank, for the development bonus
+NOT_WHITE_BACK = ~chess.BB_RANK_1 & chess.BB_ALL
+NOT_BLACK_BACK = ~chess.BB_RANK_8 & chess.BB_ALL
+
+# Piece-square tables from the simplified evaluation function, written from
+# White's side as seen on screen (first row is rank 8, last row is rank 1)
+PST_PAWN = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    10,  10,  20,  30,  30,  20,  10,  10,
+     5,   5,  10,  25,  25,  10,   5,   5,
+     0,   0,   0,  20,  20,   0,   0,   0,
+     5,  -5, -10,   0,   0, -10,  -5,   5,
+     5,  10,  10, -20, -20,  10,  10,   5,
+     0,   0,   0,   0,   0,   0,   0,   0,
+)
+PST_KNIGHT = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)
+PST_BISHOP = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)
+PST_ROOK = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+     5,  10,  10,  10,  10,  10,  10,   5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+     0,   0,   0,   5,   5,   0,   0,   0,
+)
+PST_QUEEN = (
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+     -5,   0,   5,   5,   5,   5,   0,  -5,
+      0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+PST_KING = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+     20,  20,   0,   0,   0,   0,  20,  20,
+     20,  30,  10,   0,   0,  10,  30,  20,
+)
+
+# PST[color][piece_type][square], signed from White's point of view.
+# A white piece on square sq reads row-flipped index sq ^ 56; a black piece
+# on sq mirrors onto White's sq ^ 56, which reads index sq.
+PST = [[None] * 7, [None] * 7]
+for piece_type, table in ((chess.PAWN, PST_PAWN), (chess.KNIGHT, PST_KNIGHT), (chess.BISHOP, PST_BISHOP),
+                          (chess.ROOK, PST_ROOK), (chess.QUEEN, PST_QUEEN), (chess.KING, PST_KING)):
+    PST[chess.WHITE][piece_type] = tuple(table[sq ^ 56] for sq in chess.SQUARES)
+    PST[chess.BLACK][piece_type] = tuple(-table[sq] for sq in chess.SQUARES)
+
+# Search bound, larger than any score evaluate_board can return (mate is -10000)
+MATE = 10_000_000
+
+# Transposition table, keyed by Zobrist hash and kept across AI turns
+# Entries are (depth, flag, value, best_move, age)
+EXACT, LOWER, UPPER = 0, 1, 2
+TT_MAX_SIZE = 1 << 20
+transposition_table = {}
+tt_age = 0
+
+def tt_store(key, depth, flag, value, best_move=None):
+    """Store a search result, making room by evicting entries from older searches."""
+    if len(transposition_table) >= TT_MAX_SIZE and key not in transposition_table:
+        stale = [k for k, entry in transposition_table.items() if entry[4] != tt_age]
+        for k in stale:
+            del transposition_table[k]
+        if len(transposition_table) >= TT_MAX_SIZE:
+            transposition_table.clear()
+    transposition_table[key] = (depth, flag, value, best_move, tt_age)
+
 # Function to evaluate the chess board
 def evaluate_board(board):
     """
     Evaluate the current board state.
-    Returns a score where positive values favor White and negative values favor Black.
+    Returns a score from the point of view of the side to move,
+    so positive values favor the player whose turn it is.
     """
-    # Terminal states
-    if board.is_checkmate():
-        return -10000 if board.turn else 10000
+    # Terminal states (a single legal move generation covers both mate and stalemate)
+    if not any(board.generate_legal_moves()):
+        return -10000 if board.is_check() else 0  # Mated, or stalemate
     
-    if board.is_stalemate() or board.is_insufficient_material():
+    if board.is_insufficient_material():
         return 0  # Draw
     
-    # Piece values (standard chess piece weights)
-    piece_values = {
-        chess.PAWN: 100,
-        chess.KNIGHT: 320,
-        chess.BISHOP: 330,
-        chess.ROOK: 500,
-        chess.QUEEN: 900,
-        chess.KING: 20000  # High value for the king
-    }
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
     
-    # Material score calculation
-    material_score = 0
-    for piece_type in piece_values:
-        material_score += len(board.pieces(piece_type, chess.WHITE)) * piece_values[piece_type]
-        material_score -= len(board.pieces(piece_type, chess.BLACK)) * piece_values[piece_type]
+    # Material score calculation, counting bits straight from the bitboards
+    # (kings always cancel out, so they are left out)
+    material_score = (
+        PIECE_VALUES[chess.PAWN] * (chess.popcount(board.pawns & white) - chess.popcount(board.pawns & black))
+        + PIECE_VALUES[chess.KNIGHT] * (chess.popcount(board.knights & white) - chess.popcount(board.knights & black))
+        + PIECE_VALUES[chess.BISHOP] * (chess.popcount(board.bishops & white) - chess.popcount(board.bishops & black))
+        + PIECE_VALUES[chess.ROOK] * (chess.popcount(board.rooks & white) - chess.popcount(board.rooks & black))
+        + PIECE_VALUES[chess.QUEEN] * (chess.popcount(board.queens & white) - chess.popcount(board.queens & black))
+    )
     
     # Positional considerations
     positional_score = 0
     
     # Central control bonus
-    central_squares = [chess.E4, chess.D4, chess.E5, chess.D5]
-    for square in central_squares:
-        piece = board.piece_at(square)
-        if piece:
-            if piece.color == chess.WHITE:
-                positional_score += 10
-            else:
-                positional_score -= 10
+    positional_score += 10 * (chess.popcount(CENTER_MASK & white) - chess.popcount(CENTER_MASK & black))
     
-    # Development bonus
-    knights_bishops = [chess.KNIGHT, chess.BISHOP]
-    for piece_type in knights_bishops:
-        for square in board.pieces(piece_type, chess.WHITE):
-            # Encourage development from back rank
-            rank = chess.square_rank(square)
-            if rank > 0:  # Piece has moved from back rank
-                positional_score += 5
-                
-        for square in board.pieces(piece_type, chess.BLACK):
-            # Encourage development from back rank
-            rank = chess.square_rank(square)
-            if rank < 7:  # Piece has moved from back rank
-                positional_score -= 5
+    # Development bonus for knights and bishops that have left the back rank
+    minors = board.knights | board.bishops
+    positional_score += 5 * (chess.popcount(minors & white & NOT_WHITE_BACK)
+                             - chess.popcount(minors & black & NOT_BLACK_BACK))
     
-    # Combine scores
+    # Piece-square tables
+    for color, occupied in ((chess.WHITE, white), (chess.BLACK, black)):
+        tables = PST[color]
+        for piece_type, pieces in ((chess.PAWN, board.pawns), (chess.KNIGHT, board.knights),
+                                   (chess.BISHOP, board.bishops), (chess.ROOK, board.rooks),
+                                   (chess.QUEEN, board.queens), (chess.KING, board.kings)):
+            table = tables[piece_type]
+            for square in chess.scan_forward(pieces & occupied):
+                positional_score += table[square]
+    
+    # Combine scores (computed from White's point of view)
     total_score = material_score + positional_score
     
-    return total_score
+    return total_score if board.turn else -total_score
+
+# Move ordering
+def mvv_lva(board, move):
+    """
+    Most-Valuable-Victim / Least-Valuable-Attacker score for a capture.
+    Returns 0 for quiet moves.
+    """
+    if not board.is_capture(move):
+        return 0
+    # En passant captures land on an empty square, the victim is always a pawn
+    victim = board.piece_type_at(move.to_square) or chess.PAWN
+    attacker = board.piece_type_at(move.from_square)
+    return 10 * PIECE_VALUES[victim] - PIECE_VALUES[attacker]
+
+def ordered_moves(board, tt_move=None):
+    """
+    Yield the legal moves, best candidates first.
+    The TT move is tried before any ordering work is done, then captures by MVV-LVA, then quiet moves.
+    """
+    if tt_move is not None and board.is_legal(tt_move):
+        yield tt_move
+    moves = [move for move in board.legal_moves if move != tt_move]
+    moves.sort(key=lambda move: (not board.is_capture(move), -mvv_lva(board, move)))
+    yield from moves
+
+def is_losing_capture(board, move):
+    """
+    Cheap static exchange test: a capture is assumed to lose material when a
+    more valuable piece takes a less valuable one on a defended square.
+    """
+    victim = board.piece_type_at(move.to_square) or chess.PAWN
+    attacker = board.piece_type_at(move.from_square)
+    return PIECE_VALUES[attacker] > PIECE_VALUES[victim] and board.is_attacked_by(not board.turn, move.to_square)
+
+def has_non_pawn_material(board):
+    """True if the side to move has pieces other than pawns and the king."""
+    return bool(board.occupied_co[board.turn] & ~(board.pawns | board.kings))
+
+# Quiescence search
+QUIESCENCE_DEPTH = 4
+
+def quiescence(board, alpha, beta, depth=QUIESCENCE_DEPTH):
+    """
+    Search only captures until the position is quiet, so that the static
+    evaluation is never taken in the middle of an exchange.
+    Returns a fail-soft score from the point of view of the side to move.
+    """
+    stand_pat = evaluate_board(board)
+    if stand_pat >= beta or depth == 0:
+        return stand_pat
+    alpha = max(alpha, stand_pat)
+    
+    best_value = stand_pat
+    # Only generate moves landing on enemy pieces (or en passant) instead of filtering all legal moves
+    captures = list(board.generate_legal_captures())
+    captures.sort(key=lambda move: mvv_lva(board, move), reverse=True)
+    for move in captures:
+        if is_losing_capture(board, move):
+            continue
+        board.push(move)
+        value = -quiescence(board, -beta, -alpha, depth - 1)
+        board.pop()
+        if value > best_value:
+            best_value = value
+        if value > alpha:
+            alpha = value
+        if alpha >= beta:
+            break  # Cutoff
+    return best_value
 
 # Alpha-Beta pruning algorithm
+NULL_MOVE_REDUCTION = 2
+
 def alpha_beta(board, depth, alpha, beta):
     """
-    Alpha-beta pruning algorithm.
-    Returns the evaluation score of the best move from the current position.
+    Fail-soft negamax alpha-beta pruning algorithm.
+    Returns the evaluation score of the best move from the current position,
+    from the point of view of the side to move.
     """
-    if depth == 0 or board.is_game_over():
-        return evaluate_board(board)
+    alpha_orig, beta_orig = alpha, beta
+
+    # Probe the transposition table
+    key = chess.polyglot.zobrist_hash(board)
+    entry = transposition_table.get(key)
+    tt_move = entry[3] if entry is not None else None
+    if entry is not None and entry[0] >= depth:
+        _, flag, value, _, _ = entry
+        if flag == EXACT:
+            return value
+        elif flag == LOWER:
+            alpha = max(alpha, value)
+        elif flag == UPPER:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value
+
+    if board.is_game_over():
+        value = evaluate_board(board)
+        tt_store(key, depth, EXACT, value)
+        return value
     
-    if board.turn:  # White's turn (maximizing)
-        max_value = float('-inf')
-        for move in board.legal_moves:
-            board.push(move)
-            eval = alpha_beta(board, depth - 1, alpha, beta)
-            board.pop()
-            max_value = max(max_value, eval)
-            alpha = max(alpha, eval)
-            if beta <= alpha:
-                break  # Beta cutoff
-        return max_value
-    else:  # Black's turn (minimizing)
-        min_value = float('inf')
-        for move in board.legal_moves:
+    # Null-move pruning: if passing the turn still fails high, a real move will too.
+    # Skipped in check and in pawn endings, where zugzwang makes passing unsound.
+    if depth >= 3 and not board.is_check() and has_non_pawn_material(board):
+        board.push(chess.Move.null())
+        value = -alpha_beta(board, depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1)
+        board.pop()
+        if value >= beta:
+            return beta
+    
+    best_move = None
+    if depth == 0:
+        # Resolve pending captures before trusting the static evaluation
+        value = quiescence(board, alpha, beta)
+    else:
+        best_value = -MATE
+        for move in ordered_moves(board, tt_move):
             board.push(move)
-            eval = alpha_beta(board, depth - 1, alpha, beta)
+            if depth == 1:
+                # Frontier node: go straight to quiescence instead of paying for a depth-0
+                # alpha_beta frame (hash, TT probe, game-over test) per leaf.
+                # evaluate_board already scores mate and stalemate.
+                value = -quiescence(board, -beta, -alpha)
+            else:
+                value = -alpha_beta(board, depth - 1, -beta, -alpha)
             board.pop()
-            min_value = min(min_value, eval)
-            beta = min(beta, eval)
-            if beta <= alpha:
-                break  # Alpha cutoff
-        return min_value
+            if value > best_value:
+                best_value = value
+                best_move = move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break  # Cutoff
+        value = best_value
 
-# Function to get the best move using alpha-beta pruning
-def get_best_move(board, depth=3, alpha=float('-inf'), beta=float('inf')):
+    # Store the result with the kind of bound it represents
+    if value <= alpha_orig:
+        flag = UPPER
+    elif value >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    tt_store(key, depth, flag, value, best_move)
+    return value
+
+# Root search for one iteration of get_best_move
+def search_root(board, depth, alpha, beta, first_move=None, deadline=None):
     """
-    Find the best move for the current player using alpha-beta pruning.
+    Search every root move to the given depth within the (alpha, beta) window.
+    Returns (best_value, best_move, timed_out); timed_out is True if the deadline
+    passed before all moves were searched.
     """
+    best_value = -MATE
     best_move = None
+    for move in ordered_moves(board, first_move):
+        if deadline is not None and time.monotonic() > deadline:
+            return best_value, best_move, True
+        board.push(move)
+        move_value = -alpha_beta(board, depth - 1, -beta, -alpha)
+        board.pop()
+        
+        if move_value > best_value:
+            best_value = move_value
+            best_move = move
+        
+        alpha = max(alpha, best_value)
+        if alpha >= beta:
+            break  # Fail high, the caller re-searches with a wider window
+    return best_value, best_move, False
+
+# Half-width of the aspiration window around the previous iteration's score
+ASPIRATION_WINDOW = 50
+
+# Function to get the best move using alpha-beta pruning
+def get_best_move(board, depth=3, alpha=-MATE, beta=MATE, time_limit=None):
+    """
+    Find the best move for the current player using iterative deepening alpha-beta search.
+    Each iteration tries the previous iteration's best move first and searches a narrow
+    aspiration window around its score, re-searching with the full window if the score
+    falls outside it. If time_limit (seconds) runs out, the best move of the deepest
+    completed iteration is returned.
+    """
+    global tt_age
+    tt_age += 1
+    deadline = time.monotonic() + time_limit if time_limit is not None else None
+    entry = transposition_table.get(chess.polyglot.zobrist_hash(board))
+    best_move = entry[3] if entry is not None else None
+    prev_score = None
     
-    if board.turn:  # White's turn (maximizing)
-        best_value = float('-inf')
-        for move in board.legal_moves:
-            board.push(move)
-            move_value = alpha_beta(board, depth - 1, alpha, beta)
-            board.pop()
-            
-            if move_value > best_value:
-                best_value = move_value
-                best_move = move
-            
-            alpha = max(alpha, best_value)
-    else:  # Black's turn (minimizing)
-        best_value = float('inf')
-        for move in board.legal_moves:
-            board.push(move)
-            move_value = alpha_beta(board, depth - 1, alpha, beta)
-            board.pop()
-            
-            if move_value < best_value:
-                best_value = move_value
-                best_move = move
-            
-            beta = min(beta, best_value)
+    for d in range(1, depth + 1):
+        if prev_score is None:
+            window_alpha, window_beta = alpha, beta
+        else:
+            window_alpha = max(alpha, prev_score - ASPIRATION_WINDOW)
+            window_beta = min(beta, prev_score + ASPIRATION_WINDOW)
+        value, iteration_move, timed_out = search_root(board, d, window_alpha, window_beta, best_move, deadline)
+        
+        if not timed_out and ((value <= window_alpha and window_alpha > alpha)
+                              or (value >= window_beta and window_beta < beta)):
+            # Fail low or fail high: the score is only a bound, search again with the full window
+            value, iteration_move, timed_out = search_root(board, d, alpha, beta, best_move, deadline)
+        
+        if timed_out:
+            break
+        best_move = iteration_move
+        prev_score = value
     
     # If no best move found (unlikely), choose a random move
     if best_move is None and board.legal_moves:
@@ -182,31 +421,18 @@ def get_best_move(board, depth=3, alpha=float('-inf'), beta=float('inf')):
 def draw_board(board, selected_square=None):
     """Draw the chess board and pieces"""
     # Draw the squares
-    for row in range(8):
-        for col in range(8):
-            color = LIGHT_SQUARE if (row + col) % 2 == 0 else DARK_SQUARE
-            pygame.draw.rect(screen, color, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+    screen.blit(BOARD_BG, (0, 0))
     
     # Highlight selected square if any
     if selected_square is not None:
         col, row = selected_square % 8, 7 - (selected_square // 8)
-        s = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-        s.fill(HIGHLIGHT)
-        screen.blit(s, (col * SQUARE_SIZE, row * SQUARE_SIZE))
+        screen.blit(HIGHLIGHT_SURF, (col * SQUARE_SIZE, row * SQUARE_SIZE))
     
-    # Draw the pieces
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            # Convert chess square to row, col
-            col = chess.square_file(square)
-            row = 7 - chess.square_rank(square)  # Invert row because chess uses 1-8 from bottom to top
-            
-            piece_id = ('w' if piece.color else 'b') + piece.symbol().lower()
-            if piece_id in piece_images:
-                screen.blit(piece_images[piece_id], (col * SQUARE_SIZE, row * SQUARE_SIZE))
-            else:
-                print(f"Missing image for piece: {piece_id}")
+    # Draw the pieces, visiting only occupied squares
+    white = board.occupied_co[chess.WHITE]
+    for square in chess.scan_forward(board.occupied):
+        color = bool(white & chess.BB_SQUARES[square])
+        screen.blit(piece_images_indexed[color][board.piece_type_at(square)], SQUARE_POS[square])
 
 # Convert mouse position to chess square
 def get_square_from_pos(pos):
@@ -237,19 +463,46 @@ def main():
     human_turn = player_color == board.turn
     selected_square = None
     moves_from_selected = []
+    # Legal moves for the current position, regenerated only after a move is pushed
+    legal = None
+    legal_set = None
+    # The AI searches a copy of the board in a background thread so the window stays responsive
+    ai_thread = None
+    ai_result = []
+    # Only redraw when the board or selection changed (or the window needs repainting)
+    dirty = True
+    
+    # Keep mouse-motion and other unused events out of the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([QUIT, MOUSEBUTTONDOWN, VIDEOEXPOSE])
     
     running = True
     
     while running:
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events; when nothing needs drawing, sleep until an event arrives
+        # or the timeout passes so a finished AI search is still picked up
+        if dirty:
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(100)
+            events = [event] + pygame.event.get() if event.type != NOEVENT else []
+        
+        for event in events:
             if event.type == QUIT:
                 running = False
             
+            if event.type == VIDEOEXPOSE:
+                dirty = True
+            
             if human_turn and event.type == MOUSEBUTTONDOWN:
+                dirty = True
                 pos = pygame.mouse.get_pos()
                 square = get_square_from_pos(pos)
                 
+                if legal is None:
+                    legal = list(board.legal_moves)
+                    legal_set = {(m.from_square, m.to_square, m.promotion) for m in legal}
+                
                 # If a square is already selected
                 if selected_square is not None:
                     # Try to make a move
@@ -262,8 +515,9 @@ def main():
                         move = chess.Move(selected_square, square, promotion=chess.QUEEN)
                     
                     # If the move is legal, make it
-                    if move in board.legal_moves:
+                    if (move.from_square, move.to_square, move.promotion) in legal_set:
                         board.push(move)
+                        legal = None
                         print(f"Human move: {move.uci()}")
                         human_turn = False
                         selected_square = None
@@ -274,7 +528,7 @@ def main():
                         if piece and piece.color == player_color:
                             selected_square = square
                             # Find all legal moves from this square
-                            moves_from_selected = [move for move in board.legal_moves if move.from_square == square]
+                            moves_from_selected = [move for move in legal if move.from_square == square]
                         else:
                             selected_square = None
                             moves_from_selected = []
@@ -284,31 +538,45 @@ def main():
                     if piece and piece.color == player_color:
                         selected_square = square
                         # Find all legal moves from this square
-                        moves_from_selected = [move for move in board.legal_moves if move.from_square == square]
+                        moves_from_selected = [move for move in legal if move.from_square == square]
         
         # AI's turn
         if not human_turn and not board.is_game_over():
-            print("AI is thinking...")
-            ai_move = get_best_move(board, depth=3)  # Adjust depth for stronger AI (3-4 is reasonable)
-            if ai_move:
-                board.push(ai_move)
-                print(f"AI move: {ai_move.uci()}")
-            human_turn = True
-        
-        # Draw the board
-        draw_board(board, selected_square)
-        
-        # Display game status
-        if board.is_checkmate():
-            winner = "Black" if board.turn == chess.WHITE else "White"
-            print(f"Checkmate! {winner} wins.")
-            running = False
-        elif board.is_stalemate() or board.is_insufficient_material():
-            print("Game drawn.")
-            running = False
+            if ai_thread is None:
+                print("AI is thinking...")
+                ai_result = []
+                ai_thread = threading.Thread(
+                    target=lambda search_board, result: result.append(get_best_move(search_board, depth=3)),  # Adjust depth for stronger AI (3-4 is reasonable)
+                    args=(board.copy(), ai_result),
+                    daemon=True,
+                )
+                ai_thread.start()
+            elif ai_result:
+                ai_move = ai_result[0]
+                if ai_move:
+                    board.push(ai_move)
+                    legal = None
+                    print(f"AI move: {ai_move.uci()}")
+                ai_thread = None
+                human_turn = True
+                dirty = True
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if dirty:
+            # Draw the board
+            draw_board(board, selected_square)
+            
+            # Display game status
+            if board.is_checkmate():
+                winner = "Black" if board.turn == chess.WHITE else "White"
+                print(f"Checkmate! {winner} wins.")
+                running = False
+            elif board.is_stalemate() or board.is_insufficient_material():
+                print("Game drawn.")
+                running = False
+            
+            pygame.display.flip()
+            dirty = False
+            clock.tick(FPS)
     
     pygame.quit()
     sys.exit()
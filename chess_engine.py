@@ -4,6 +4,8 @@ import random
 import sys
 import time
 
+from chess_gfx import get_indexed_piece_images
+
 # Constants for the board dimensions and colors
 WIDTH = HEIGHT = 640  # Board size in pixels (8x8 squares)
 SQ_SIZE = WIDTH // 8
@@ -14,96 +16,65 @@ LIGHT_COLOR = (240, 217, 181)
 DARK_COLOR = (181, 136, 99)
 HIGHLIGHT_COLOR = (186, 202, 68)
 
-# Global dictionary to store images
-IMAGES = {}
+# Piece images indexed as [color][piece_type], filled by load_images()
+IMAGES_INDEXED = None
+
+# Screen position of each square on an unflipped board; a flipped board uses square 63 ^ sq
+POS_TABLE = [(chess.square_file(sq) * SQ_SIZE, (7 - chess.square_rank(sq)) * SQ_SIZE) for sq in chess.SQUARES]
+
+# Pre-rendered checkerboard, built once by render_board_background()
+BOARD_BG = None
 
 def load_images():
     """
-    Load chess piece images from the images folder.
-    The mapping from piece symbol to image file is as follows:
-      White Pieces:
-         'P' -> white-pawn.png
-         'N' -> white-knight.png
-         'B' -> white-bishop.png
-         'R' -> white-rook.png
-         'Q' -> white-queen.png
-         'K' -> white-king.png
-      Black Pieces:
-         'p' -> black-pawn.png
-         'n' -> black-knight.png
-         'b' -> black-bishop.png
-         'r' -> black-rook.png
-         'q' -> black-queen.png
-         'k' -> black-king.png
+    Load chess piece images from the images folder (see chess_gfx.PIECE_FILES).
+    Must be called after the display has been created.
     """
-    pieces = {
-        "P": "white-pawn.png",
-        "N": "white-knight.png",
-        "B": "white-bishop.png",
-        "R": "white-rook.png",
-        "Q": "white-queen.png",
-        "K": "white-king.png",
-        "p": "black-pawn.png",
-        "n": "black-knight.png",
-        "b": "black-bishop.png",
-        "r": "black-rook.png",
-        "q": "black-queen.png",
-        "k": "black-king.png"
-    }
-    for symbol, filename in pieces.items():
-        path = "images/" + filename
-        try:
-            image = pygame.image.load(path)
-        except pygame.error as e:
-            print(f"Unable to load image at path: {path}")
-            raise e
-        IMAGES[symbol] = pygame.transform.scale(image, (SQ_SIZE, SQ_SIZE))
+    global IMAGES_INDEXED
+    IMAGES_INDEXED = get_indexed_piece_images(SQ_SIZE)
 
-def draw_board(screen, flip_board, selected_sq):
+def render_board_background():
     """
-    Draw the chess board with optional highlight for the selected square.
+    Draw the 64 squares once into a surface that draw_board can blit every frame.
+    The light/dark pattern is the same whether or not the board is flipped.
+    Must be called after the display has been created.
     """
+    global BOARD_BG
+    BOARD_BG = pygame.Surface((WIDTH, HEIGHT)).convert()
     for rank in range(8):
         for file in range(8):
-            # Adjust square positions if board is flipped.
-            draw_file = file if not flip_board else 7 - file
-            draw_rank = rank if not flip_board else 7 - rank
-
-            x = draw_file * SQ_SIZE
-            # Pygame's (0,0) is top-left; we draw from bottom (rank 0 at bottom)
-            y = (7 - draw_rank) * SQ_SIZE
-
             color = LIGHT_COLOR if (file + rank) % 2 == 0 else DARK_COLOR
-            rect = pygame.Rect(x, y, SQ_SIZE, SQ_SIZE)
-            pygame.draw.rect(screen, color, rect)
-
-            # Highlight the selected square if applicable.
-            if selected_sq is not None:
-                sel_file = chess.square_file(selected_sq)
-                sel_rank = chess.square_rank(selected_sq)
-                if flip_board:
-                    sel_file = 7 - sel_file
-                    sel_rank = 7 - sel_rank
-                # Compare with current square coordinates.
-                if sel_file == file and sel_rank == rank:
-                    pygame.draw.rect(screen, HIGHLIGHT_COLOR, rect, 4)
+            rect = pygame.Rect(file * SQ_SIZE, (7 - rank) * SQ_SIZE, SQ_SIZE, SQ_SIZE)
+            pygame.draw.rect(BOARD_BG, color, rect)
+
+def draw_board(screen, flip_board, selected_sq):
+    """
+    Draw the chess board with optional highlight for the selected square.
+    """
+    screen.blit(BOARD_BG, (0, 0))
+
+    # Highlight the selected square if applicable.
+    if selected_sq is not None:
+        file = chess.square_file(selected_sq)
+        rank = chess.square_rank(selected_sq)
+        # Adjust square position if board is flipped.
+        if flip_board:
+            file = 7 - file
+            rank = 7 - rank
+        # Pygame's (0,0) is top-left; we draw from bottom (rank 0 at bottom)
+        rect = pygame.Rect(file * SQ_SIZE, (7 - rank) * SQ_SIZE, SQ_SIZE, SQ_SIZE)
+        pygame.draw.rect(screen, HIGHLIGHT_COLOR, rect, 4)
 
 def draw_pieces(screen, board, flip_board):
     """
     Draw all pieces on the board based on the current board state.
     """
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            file = chess.square_file(square)
-            rank = chess.square_rank(square)
-            if flip_board:
-                file = 7 - file
-                rank = 7 - rank
-            x = file * SQ_SIZE
-            y = (7 - rank) * SQ_SIZE
-            symbol = piece.symbol()  # Uppercase for white, lowercase for black.
-            screen.blit(IMAGES[symbol], pygame.Rect(x, y, SQ_SIZE, SQ_SIZE))
+    white = board.occupied_co[chess.WHITE]
+    for square in chess.scan_forward(board.occupied):
+        color = bool(white & chess.BB_SQUARES[square])
+        image = IMAGES_INDEXED[color][board.piece_type_at(square)]
+        # Flipping both file and rank mirrors the square index.
+        screen.blit(image, POS_TABLE[63 ^ square if flip_board else square])
 
 def get_square_from_mouse(pos, flip_board):
     """
@@ -129,6 +100,7 @@ def main():
     pygame.display.set_caption("Chess Game: Human vs. Random AI")
     clock = pygame.time.Clock()
     load_images()
+    render_board_background()
 
     board = chess.Board()
 
@@ -142,6 +114,11 @@ def main():
     flip_board = not human_is_white
 
     selected_sq = None  # Currently selected square for a move
+    dirty = True  # Redraw only after the board or selection changed
+
+    # Keep mouse-motion and other unused events out of the queue.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE])
 
     running = True
     while running:
@@ -149,12 +126,20 @@ def main():
         human_turn = (board.turn == chess.WHITE and human_is_white) or (board.turn == chess.BLACK and not human_is_white)
 
         if human_turn:
-            for event in pygame.event.get():
+            if dirty:
+                events = pygame.event.get()
+            else:
+                # Nothing to redraw: sleep until the player does something.
+                events = [pygame.event.wait()] + pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                     pygame.quit()
                     sys.exit()
+                elif event.type == pygame.VIDEOEXPOSE:
+                    dirty = True
                 elif event.type == pygame.MOUSEBUTTONDOWN:
+                    dirty = True
                     pos = pygame.mouse.get_pos()
                     sq = get_square_from_mouse(pos, flip_board)
                     if selected_sq is None:
@@ -181,19 +166,22 @@ def main():
             ai_move = get_random_ai_move(board)
             board.push(ai_move)
             print("AI played:", ai_move.uci())
-
-        # Redraw board and pieces.
-        draw_board(screen, flip_board, selected_sq)
-        draw_pieces(screen, board, flip_board)
-        pygame.display.flip()
-
-        # Check if the game is over.
-        if board.is_game_over():
-            print("Game over. Result:", board.result())
-            time.sleep(3)
-            running = False
-
-        clock.tick(FPS)
+            dirty = True
+
+        if dirty:
+            # Redraw board and pieces.
+            draw_board(screen, flip_board, selected_sq)
+            draw_pieces(screen, board, flip_board)
+            pygame.display.flip()
+            dirty = False
+
+            # Check if the game is over.
+            if board.is_game_over():
+                print("Game over. Result:", board.result())
+                time.sleep(3)
+                running = False
+
+            clock.tick(FPS)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,58 @@
+import functools
+import os
+
+import chess
+import pygame
+
+# Folder holding the piece images, next to this file
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+
+# Mapping from piece symbol (uppercase for white, lowercase for black) to image file
+PIECE_FILES = {
+    "P": "white-pawn.png",
+    "N": "white-knight.png",
+    "B": "white-bishop.png",
+    "R": "white-rook.png",
+    "Q": "white-queen.png",
+    "K": "white-king.png",
+    "p": "black-pawn.png",
+    "n": "black-knight.png",
+    "b": "black-bishop.png",
+    "r": "black-rook.png",
+    "q": "black-queen.png",
+    "k": "black-king.png"
+}
+
+@functools.lru_cache(maxsize=None)
+def get_piece_images(sq_size):
+    """
+    Load the chess piece images scaled to sq_size, keyed by piece symbol.
+    Images are loaded once per size and shared by every caller.
+    A missing image is replaced by a red placeholder square.
+    Surfaces are converted to the display format when a display exists.
+    """
+    images = {}
+    for symbol, filename in PIECE_FILES.items():
+        path = os.path.join(IMAGES_DIR, filename)
+        try:
+            image = pygame.transform.scale(pygame.image.load(path), (sq_size, sq_size))
+        except (pygame.error, FileNotFoundError):
+            print(f"Warning: Could not load image for {symbol} from {path}")
+            image = pygame.Surface((sq_size, sq_size), pygame.SRCALPHA)
+            pygame.draw.rect(image, (255, 0, 0, 128), (0, 0, sq_size, sq_size))
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        images[symbol] = image
+    return images
+
+@functools.lru_cache(maxsize=None)
+def get_indexed_piece_images(sq_size):
+    """
+    The images from get_piece_images indexed as [color][piece_type]
+    (chess.BLACK == 0, chess.WHITE == 1, index 0 of each list is unused).
+    """
+    indexed = [[None] * 7, [None] * 7]
+    for symbol, image in get_piece_images(sq_size).items():
+        piece = chess.Piece.from_symbol(symbol)
+        indexed[piece.color][piece.piece_type] = image
+    return indexed